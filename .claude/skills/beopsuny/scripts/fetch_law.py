@@ -24,7 +24,7 @@ import yaml
 
 # 게이트웨이 유틸리티 (해외 접근 지원)
 try:
-    from gateway import fetch_url, is_gateway_configured
+    from gateway import _load_config as gateway_load_config, fetch_url, is_gateway_configured
     HAS_GATEWAY = True
 except ImportError:
     HAS_GATEWAY = False
@@ -49,7 +49,13 @@ _law_index_cache = None
 
 
 def _load_config_file():
-    """설정 파일 로드 (캐싱)"""
+    """설정 파일 로드 (캐싱)
+
+    gateway 모듈이 있으면 그 로더를 사용합니다 (settings.json 우선).
+    """
+    if HAS_GATEWAY:
+        return gateway_load_config()
+
     global _config_cache
     if _config_cache is not None:
         return _config_cache
@@ -7,77 +7,137 @@ Korean Policy Stance Fetcher - 정부 정책 집행 동향 수집
 
 Usage:
     python fetch_policy.py rss [부처코드] [--keyword 키워드]
-    python fetch_policy.py interpret "검색어" [--display 20]
-    python fetch_policy.py legislative [--status ongoing|completed] [--days 30]
-    python fetch_policy.py summary [--days 7]
+    python fetch_policy.py interpret "검색어" [--display 20] [--no-cache]
+    python fetch_policy.py legislative [--status ongoing|completed|all] [--days 30]
+                                       [--pages 1] [--no-cache]
+    python fetch_policy.py summary [--days 7] [--json] [--no-cache]
 """
 
 import argparse
+import hashlib
+import io
 import json
 import os
+import pickle
 import re
 import socket
+import sqlite3
 import sys
+import threading
+import time
 import urllib.error
 import urllib.parse
 import urllib.request
-import xml.etree.ElementTree as ET
+import xml.sax
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-
-try:
-    import feedparser
-    HAS_FEEDPARSER = True
-except ImportError:
-    HAS_FEEDPARSER = False
-
-import yaml
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
 
 # 게이트웨이 유틸리티 (해외 접근 지원)
 try:
-    from gateway import fetch_url as gateway_fetch_url, is_gateway_configured, get_geo_status
+    from gateway import (
+        _load_config as gateway_load_config,
+        fetch_url as gateway_fetch_url,
+        get_geo_status,
+        is_gateway_configured,
+        open_direct as gateway_open_direct,
+    )
     HAS_GATEWAY = True
 except ImportError:
     HAS_GATEWAY = False
 
+# 다중 키워드 매칭 가속 (선택, pyahocorasick)
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
 # 스크립트 위치 기준으로 경로 설정
 SCRIPT_DIR = Path(__file__).parent
 SKILL_DIR = SCRIPT_DIR.parent
 CONFIG_PATH = SKILL_DIR / "config" / "settings.yaml"
 DATA_POLICY_DIR = SKILL_DIR / "data" / "policy"
+RSS_CACHE_PATH = DATA_POLICY_DIR / "rss_cache.json"
+# 캐시 항목 형식이 바뀌면 올려서 이전 캐시를 무시 (2: 요약 전문 저장)
+RSS_CACHE_VERSION = 2
+QUERY_CACHE_PATH = DATA_POLICY_DIR / "cache.sqlite"
 
 # 환경변수 이름
 ENV_OC_CODE = "BEOPSUNY_OC_CODE"
 ENV_DATA_GO_KR_KEY = "BEOPSUNY_DATA_GO_KR_KEY"
 
-# 정부 부처 RSS 피드 URL (정책브리핑 korea.kr)
-RSS_FEEDS = {
-    "ftc": {
-        "name": "공정거래위원회",
-        "url": "https://korea.kr/rss/dept_ftc.xml",
-        "keywords": ["공정거래", "하도급", "가맹", "과징금", "시정명령", "불공정거래"],
-    },
-    "moel": {
-        "name": "고용노동부",
-        "url": "https://korea.kr/rss/dept_moel.xml",
-        "keywords": ["근로기준", "산업안전", "임금", "해고", "노동", "고용"],
-    },
-    "fsc": {
-        "name": "금융위원회",
-        "url": "https://korea.kr/rss/dept_fsc.xml",
-        "keywords": ["금융", "제재", "자본시장", "금융소비자", "과징금"],
-    },
-    "pipc": {
-        "name": "개인정보보호위원회",
-        "url": "https://korea.kr/rss/dept_pipc.xml",
-        "keywords": ["개인정보", "과징금", "제재", "시정조치"],
-    },
-    "moleg": {
-        "name": "법제처",
-        "url": "https://korea.kr/rss/dept_moleg.xml",
-        "keywords": ["법령", "입법", "법제"],
-    },
+class Feed(NamedTuple):
+    """부처 RSS 피드 정보"""
+    code: str
+    name: str
+    url: str
+    keywords: Tuple[str, ...]
+
+
+# 정부 부처 RSS 피드 URL (정책브리핑 korea.kr, 출력 순서대로)
+RSS_FEEDS = (
+    Feed(
+        "ftc", "공정거래위원회", "https://korea.kr/rss/dept_ftc.xml",
+        ("공정거래", "하도급", "가맹", "과징금", "시정명령", "불공정거래"),
+    ),
+    Feed(
+        "moel", "고용노동부", "https://korea.kr/rss/dept_moel.xml",
+        ("근로기준", "산업안전", "임금", "해고", "노동", "고용"),
+    ),
+    Feed(
+        "fsc", "금융위원회", "https://korea.kr/rss/dept_fsc.xml",
+        ("금융", "제재", "자본시장", "금융소비자", "과징금"),
+    ),
+    Feed(
+        "pipc", "개인정보보호위원회", "https://korea.kr/rss/dept_pipc.xml",
+        ("개인정보", "과징금", "제재", "시정조치"),
+    ),
+    Feed(
+        "moleg", "법제처", "https://korea.kr/rss/dept_moleg.xml",
+        ("법령", "입법", "법제"),
+    ),
+)
+
+# 부처 코드 -> 피드 정보
+RSS_FEEDS_BY_CODE = {feed.code: feed for feed in RSS_FEEDS}
+
+# 제재/처분 관련 보도자료 판별 키워드 (summary용)
+ENFORCEMENT_KEYWORDS = ["제재", "과징금", "시정명령", "시정조치", "위반", "처분"]
+
+
+def _keyword_matcher(keywords: Iterable[str]):
+    """키워드 집합 중 하나라도 포함되는지 검사하는 함수 생성
+
+    pyahocorasick이 있으면 Aho-Corasick 오토마톤으로 한 번에 스캔하고,
+    없으면 키워드를 OR로 묶은 단일 정규식으로 검사합니다.
+
+    Args:
+        keywords: 검사할 키워드 목록
+
+    Returns:
+        문자열을 받아 키워드 포함 여부를 반환하는 함수
+    """
+    if HAS_AHOCORASICK:
+        automaton = ahocorasick.Automaton()
+        for keyword in keywords:
+            automaton.add_word(keyword, keyword)
+        automaton.make_automaton()
+        return lambda text: next(automaton.iter(text), None) is not None
+
+    pattern = re.compile("|".join(map(re.escape, keywords)))
+    return lambda text: pattern.search(text) is not None
+
+
+has_enforcement_keyword = _keyword_matcher(ENFORCEMENT_KEYWORDS)
+
+# HTTP 요청 헤더
+HTTP_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (compatible; Beopsuny/1.0; +https://github.com/sungjunlee/beopsuny)"
 }
 
 # API 엔드포인트
@@ -88,15 +148,33 @@ API_ENDPOINTS = {
 
 # 캐시
 _config_cache = None
+_rss_entries_cache: Dict[str, List[Dict[str, str]]] = {}  # 부처 코드 -> 항목 (프로세스 내)
+
+# 법령해석례/입법예고 조회 결과 캐시 (SQLite)
+QUERY_CACHE_TTL = 24 * 60 * 60  # 초
+_query_cache_conn: Optional[sqlite3.Connection] = None
+_query_cache_lock = threading.Lock()  # summary에서 여러 스레드가 공유
+_query_cache_enabled = True  # --no-cache 시 읽기만 건너뜀 (새 결과는 저장)
+
+# API 응답을 SAX 파서에 나눠 넣는 단위
+SAX_FEED_SIZE = 64 * 1024
 
 
 def _load_config_file():
-    """설정 파일 로드 (캐싱)"""
+    """설정 파일 로드 (캐싱)
+
+    gateway 모듈의 로더를 사용합니다 (settings.json 우선, 파싱 결과 디스크 캐싱).
+    """
+    if HAS_GATEWAY:
+        return gateway_load_config()
+
     global _config_cache
     if _config_cache is not None:
         return _config_cache
 
     if CONFIG_PATH.exists():
+        import yaml
+
         with open(CONFIG_PATH, "r", encoding="utf-8") as f:
             _config_cache = yaml.safe_load(f) or {}
     else:
@@ -145,25 +223,42 @@ def fetch_url(url: str, timeout: int = 30) -> str:
     Raises:
         RuntimeError: 네트워크 오류 발생 시
     """
-    # 게이트웨이 유틸리티 사용 가능하면 자동 처리
+    with fetch_stream(url, timeout) as stream:
+        return stream.read().decode("utf-8")
+
+
+@contextmanager
+def fetch_stream(url: str, timeout: int = 30) -> Iterator[BinaryIO]:
+    """URL 응답을 바이너리 스트림으로 열기 (게이트웨이 설정 시 자동 사용)
+
+    직접 접근 시에는 HTTP 응답 객체를 그대로 넘겨 다운로드 중에 파싱을
+    시작할 수 있게 합니다. 게이트웨이 경유 시에는 받은 본문을 메모리
+    스트림으로 감싸 같은 인터페이스로 제공합니다.
+
+    Args:
+        url: 요청할 URL
+        timeout: 타임아웃 (초)
+
+    Yields:
+        read()를 지원하는 바이너리 스트림
+
+    Raises:
+        RuntimeError: 네트워크 오류 발생 시
+    """
     if HAS_GATEWAY:
-        try:
-            return gateway_fetch_url(url, timeout=timeout)
-        except ValueError as e:
-            # 게이트웨이 미설정 시 직접 시도
-            print(f"Note: {e}", file=sys.stderr)
-            print("Attempting direct connection...", file=sys.stderr)
+        if is_gateway_configured():
+            content = gateway_fetch_url(url, timeout=timeout)
+            yield io.BytesIO(content.encode("utf-8"))
+        else:
+            # 호스트별 keep-alive 연결을 재사용하여 핸드셰이크 생략
+            with gateway_open_direct(url, timeout, headers=HTTP_HEADERS) as response:
+                yield response
+        return
 
-    # 직접 접근 (게이트웨이 미설정)
+    # 직접 접근 (gateway.py 없음)
     try:
-        req = urllib.request.Request(
-            url,
-            headers={
-                "User-Agent": "Mozilla/5.0 (compatible; Beopsuny/1.0; +https://github.com/sungjunlee/beopsuny)"
-            },
-        )
-        with urllib.request.urlopen(req, timeout=timeout) as response:
-            return response.read().decode("utf-8")
+        req = urllib.request.Request(url, headers=HTTP_HEADERS)
+        response = urllib.request.urlopen(req, timeout=timeout)
     except urllib.error.HTTPError as e:
         raise RuntimeError(f"HTTP error {e.code}: {e.reason}") from e
     except urllib.error.URLError as e:
@@ -173,17 +268,215 @@ def fetch_url(url: str, timeout: int = 30) -> str:
     except Exception as e:
         raise RuntimeError(f"Unexpected error fetching URL: {e}") from e
 
+    with response:
+        yield response
+
+
+def _emit(lines: List[str]) -> None:
+    """출력 줄을 모아 한 번에 stdout에 쓰기"""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
+# ============================================================
+# 조회 결과 캐시 (SQLite)
+# ============================================================
+
+
+def _query_cache_key(endpoint: str, params: Dict[str, Any]) -> str:
+    """엔드포인트와 조회 조건으로 캐시 키 생성"""
+    raw = f"{endpoint}|{sorted(params.items())!r}"
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _query_cache_connection() -> sqlite3.Connection:
+    """캐시 DB 연결 (최초 호출 시 생성, 호출 측에서 _query_cache_lock 보유)"""
+    global _query_cache_conn
+    if _query_cache_conn is None:
+        ensure_data_dir()
+        conn = sqlite3.connect(QUERY_CACHE_PATH, timeout=5, check_same_thread=False)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS query_cache "
+            "(key TEXT PRIMARY KEY, ts INTEGER NOT NULL, value BLOB NOT NULL)"
+        )
+        _query_cache_conn = conn
+    return _query_cache_conn
+
+
+def _query_cache_get(key: str) -> Optional[Any]:
+    """유효기간 내 캐시된 조회 결과 반환 (없거나 만료/손상 시 None)"""
+    if not _query_cache_enabled:
+        return None
+
+    try:
+        with _query_cache_lock:
+            row = _query_cache_connection().execute(
+                "SELECT ts, value FROM query_cache WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None or time.time() - row[0] >= QUERY_CACHE_TTL:
+            return None
+        return pickle.loads(row[1])
+    except (OSError, sqlite3.Error, pickle.UnpicklingError, EOFError):
+        return None
+
+
+def _query_cache_put(key: str, value: Any) -> None:
+    """조회 결과 저장 (실패해도 조회 결과에는 영향 없음)"""
+    try:
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        now = int(time.time())
+        with _query_cache_lock:
+            conn = _query_cache_connection()
+            # 만료된 행은 다시 쓰이지 않으므로 저장할 때 함께 정리
+            conn.execute(
+                "DELETE FROM query_cache WHERE ts <= ?", (now - QUERY_CACHE_TTL,)
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO query_cache (key, ts, value) VALUES (?, ?, ?)",
+                (key, now, blob),
+            )
+            conn.commit()
+    except (OSError, sqlite3.Error) as e:
+        print(f"Warning: 조회 캐시 저장 실패: {e}", file=sys.stderr)
+
+
+# ============================================================
+# XML 파싱 (SAX)
+# ============================================================
+
+
+class _StopParsing(Exception):
+    """필요한 레코드를 모두 모았을 때 SAX 파싱을 중단하기 위한 신호"""
+
+
+class _RecordHandler(xml.sax.ContentHandler):
+    """API 응답에서 레코드를 dict로 바로 수집하는 SAX 핸들러
+
+    Element 객체를 만들지 않고, 레코드 태그(예: expc) 안의 하위 태그를
+    {태그명: 텍스트}로 모읍니다. 레코드 밖의 value_tags(예: totalCnt)는
+    처음 나온 텍스트를 values에 보관합니다.
+    """
+
+    def __init__(
+        self,
+        record_tags: Iterable[str],
+        value_tags: Iterable[str] = (),
+        limit: Optional[int] = None,
+    ):
+        super().__init__()
+        self.record_tags = frozenset(record_tags)
+        self.value_tags = frozenset(value_tags)
+        self.limit = limit
+        self.records: List[Dict[str, str]] = []
+        self.values: Dict[str, str] = {}
+        self._row: Optional[Dict[str, str]] = None
+        self._row_tag = ""
+        self._chars: List[str] = []
+
+    def startElement(self, name, attrs):
+        if self._row is None and name in self.record_tags:
+            self._row = {}
+            self._row_tag = name
+        self._chars = []
+
+    def characters(self, content):
+        self._chars.append(content)
+
+    def endElement(self, name):
+        if self._row is not None:
+            if name == self._row_tag:
+                self.records.append(self._row)
+                self._row = None
+                if self.limit is not None and len(self.records) >= self.limit:
+                    raise _StopParsing
+            else:
+                self._row.setdefault(name, "".join(self._chars))
+        elif name in self.value_tags:
+            self.values.setdefault(name, "".join(self._chars))
+        self._chars = []
+
+
+def _parse_records(stream: BinaryIO, handler: _RecordHandler) -> _RecordHandler:
+    """스트림을 SAX로 파싱 (limit 도달 시 나머지 응답은 읽지 않음)
+
+    xml.sax.parse()는 예외 시 입력 스트림을 닫아 버려, 본문을 덜 읽은
+    keep-alive 연결이 재사용 가능한 것처럼 보이게 됩니다. 스트림은
+    호출 측(fetch_stream)이 정리하도록 파서에 직접 나눠 넣습니다.
+
+    Raises:
+        xml.sax.SAXParseException: XML 형식 오류
+    """
+    parser = xml.sax.make_parser()
+    parser.setContentHandler(handler)
+    try:
+        while True:
+            chunk = stream.read(SAX_FEED_SIZE)
+            if not chunk:
+                break
+            parser.feed(chunk)
+        parser.close()
+    except _StopParsing:
+        pass
+    return handler
+
 
 # ============================================================
 # RSS 피드 수집
 # ============================================================
 
 
+@dataclass(slots=True)
+class RssItem:
+    """보도자료 항목"""
+    dept: str
+    dept_code: str
+    title: str
+    link: str
+    published: str
+    summary: str
+
+
+def _rss_entry(entry) -> Dict[str, str]:
+    """feedparser 항목에서 사용하는 필드만 추출"""
+    return {
+        "title": entry.get("title", ""),
+        "link": entry.get("link", ""),
+        "published": entry.get("published", ""),
+        # 키워드 필터는 요약 전문을 대상으로 하므로 자르지 않고 보관 (출력 시 200자로 자름)
+        "summary": entry.get("summary") or "",
+    }
+
+
+def _load_rss_cache() -> Dict[str, Any]:
+    """RSS 캐시 로드 (부처 코드 -> etag, modified, entries)"""
+    try:
+        with open(RSS_CACHE_PATH, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict) or cache.get("_version") != RSS_CACHE_VERSION:
+        return {}
+    return cache
+
+
+def _save_rss_cache(cache: Dict[str, Any]) -> None:
+    """RSS 캐시 저장 (실패해도 수집 결과에는 영향 없음)"""
+    try:
+        ensure_data_dir()
+        cache["_version"] = RSS_CACHE_VERSION
+        tmp_path = RSS_CACHE_PATH.with_name(f"{RSS_CACHE_PATH.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(cache, f, ensure_ascii=False)
+        os.replace(tmp_path, RSS_CACHE_PATH)
+    except OSError as e:
+        print(f"Warning: RSS 캐시 저장 실패: {e}", file=sys.stderr)
+
+
 def fetch_rss(
     dept_code: Optional[str] = None,
     keyword: Optional[str] = None,
     limit: int = 20,
-) -> List[Dict[str, str]]:
+) -> List[RssItem]:
     """RSS 피드에서 보도자료 수집
 
     Args:
@@ -192,77 +485,126 @@ def fetch_rss(
         limit: 부처당 최대 건수
 
     Returns:
-        보도자료 목록
+        보도자료 목록 (RssItem)
 
     Raises:
         ImportError: feedparser 미설치 시
         ValueError: 잘못된 부처 코드
     """
-    if not HAS_FEEDPARSER:
+    # feedparser는 RSS 명령에서만 필요하므로 사용 시점에 import
+    try:
+        import feedparser
+    except ImportError:
         raise ImportError(
             "feedparser 라이브러리가 필요합니다. 설치: pip install feedparser"
-        )
+        ) from None
 
     # 부처 코드 검증
     if dept_code:
-        if dept_code not in RSS_FEEDS:
+        if dept_code not in RSS_FEEDS_BY_CODE:
             raise ValueError(
                 f"알 수 없는 부처 코드: {dept_code}. "
-                f"가능한 코드: {', '.join(RSS_FEEDS.keys())}"
+                f"가능한 코드: {', '.join(RSS_FEEDS_BY_CODE)}"
             )
-        feeds_to_check = {dept_code: RSS_FEEDS[dept_code]}
+        feeds_to_check = [RSS_FEEDS_BY_CODE[dept_code]]
     else:
         feeds_to_check = RSS_FEEDS
 
     results = []
-
-    for code, feed_info in feeds_to_check.items():
-        try:
-            feed = feedparser.parse(feed_info["url"])
-
-            # feedparser bozo 오류 체크 (파싱 경고)
-            if hasattr(feed, "bozo") and feed.bozo:
-                print(
-                    f"Warning: {feed_info['name']} RSS 파싱 경고: {feed.bozo_exception}",
-                    file=sys.stderr,
+    keyword_lower = keyword.lower() if keyword else None
+    cache = _load_rss_cache()
+    cache_updated = False
+
+    # 이 프로세스에서 이미 수집한 피드는 다시 요청하지 않음
+    pending = [feed for feed in feeds_to_check if feed.code not in _rss_entries_cache]
+    futures = {}
+
+    # 피드별 다운로드/파싱은 네트워크 대기가 대부분이므로 병렬 수행
+    # 이전 ETag/Last-Modified를 보내 변경이 없으면 304로 다운로드/파싱 생략
+    if pending:
+        with ThreadPoolExecutor(max_workers=len(pending)) as executor:
+            futures = {
+                feed.code: executor.submit(
+                    feedparser.parse,
+                    feed.url,
+                    etag=cache.get(feed.code, {}).get("etag"),
+                    modified=cache.get(feed.code, {}).get("modified"),
                 )
+                for feed in pending
+            }
 
-            if not feed.entries:
+    # 결과 처리는 메인 스레드에서 부처 순서대로
+    for feed in feeds_to_check:
+        code = feed.code
+        try:
+            if code in _rss_entries_cache:
+                entries = _rss_entries_cache[code]
+            else:
+                parsed = futures[code].result()
+                status = parsed.get("status")
+
+                if status == 304 and code in cache:
+                    entries = cache[code]["entries"]
+                else:
+                    # feedparser bozo 오류 체크 (파싱 경고)
+                    if hasattr(parsed, "bozo") and parsed.bozo:
+                        print(
+                            f"Warning: {feed.name} RSS 파싱 경고: {parsed.bozo_exception}",
+                            file=sys.stderr,
+                        )
+
+                    entries = [_rss_entry(entry) for entry in parsed.entries]
+                    if parsed.get("etag") or parsed.get("modified"):
+                        cache[code] = {
+                            "etag": parsed.get("etag"),
+                            "modified": parsed.get("modified"),
+                            "entries": entries,
+                        }
+                        cache_updated = True
+
+                # 정상 응답만 재사용 (연결 실패는 status가 없고, 오류 응답은 항목이 없음)
+                if status is not None and status < 400 and (status != 304 or code in cache):
+                    _rss_entries_cache[code] = entries
+
+            if not entries:
                 print(
-                    f"Warning: {feed_info['name']} RSS에 항목이 없습니다.",
+                    f"Warning: {feed.name} RSS에 항목이 없습니다.",
                     file=sys.stderr,
                 )
                 continue
 
-            for entry in feed.entries[:limit]:
+            for entry in entries[:limit]:
                 # 필수 필드 검증
-                title = entry.get("title", "")
+                title = entry["title"]
                 if not title:
                     continue
 
-                # 키워드 필터링
-                if keyword:
-                    title_lower = title.lower()
-                    summary_lower = entry.get("summary", "").lower()
-                    if keyword.lower() not in title_lower and keyword.lower() not in summary_lower:
+                # 키워드 필터링 (제목+요약을 한 번에 소문자화, \x1f로 경계 구분)
+                if keyword_lower:
+                    search_blob = f"{title}\x1f{entry['summary']}".lower()
+                    if keyword_lower not in search_blob:
                         continue
 
-                results.append({
-                    "dept": feed_info["name"],
-                    "dept_code": code,
-                    "title": title,
-                    "link": entry.get("link", ""),
-                    "published": entry.get("published", ""),
-                    "summary": entry.get("summary", "")[:200] if entry.get("summary") else "",
-                })
+                results.append(RssItem(
+                    dept=feed.name,
+                    dept_code=code,
+                    title=title,
+                    link=entry["link"],
+                    published=entry["published"],
+                    summary=entry["summary"][:200],
+                ))
         except Exception as e:
-            print(f"Warning: {feed_info['name']} RSS 수집 실패: {e}", file=sys.stderr)
+            print(f"Warning: {feed.name} RSS 수집 실패: {e}", file=sys.stderr)
+
+    if cache_updated:
+        _save_rss_cache(cache)
 
     return results
 
 
 def cmd_rss(args):
     """RSS 보도자료 수집 명령"""
+    out = []
     try:
         results = fetch_rss(args.dept, args.keyword, args.limit)
     except ImportError as e:
@@ -276,15 +618,17 @@ def cmd_rss(args):
         print("검색 결과가 없습니다.")
         return
 
-    print(f"\n📰 보도자료 ({len(results)}건)")
-    print("=" * 60)
+    out.append(f"\n📰 보도자료 ({len(results)}건)")
+    out.append("=" * 60)
 
     for item in results:
-        print(f"\n[{item['dept']}] {item['title']}")
-        print(f"  📅 {item['published']}")
-        print(f"  🔗 {item['link']}")
-        if item["summary"]:
-            print(f"  📝 {item['summary'][:100]}...")
+        out.append(f"\n[{item.dept}] {item.title}")
+        out.append(f"  📅 {item.published}")
+        out.append(f"  🔗 {item.link}")
+        if item.summary:
+            out.append(f"  📝 {item.summary[:100]}...")
+
+    _emit(out)
 
 
 # ============================================================
@@ -303,10 +647,10 @@ INTERPRET_FIELD_MAPPINGS = {
 }
 
 
-def _get_xml_field(item: ET.Element, field_key: str) -> str:
-    """XML 아이템에서 여러 가능한 필드명 중 첫 번째 값 반환"""
+def _get_xml_field(item: Dict[str, str], field_key: str) -> str:
+    """XML 레코드에서 여러 가능한 필드명 중 첫 번째 값 반환"""
     for field_name in INTERPRET_FIELD_MAPPINGS.get(field_key, []):
-        value = item.findtext(field_name, "")
+        value = item.get(field_name, "")
         if value:
             return value
     return ""
@@ -322,11 +666,21 @@ def _is_html_error_response(content: str) -> bool:
     )
 
 
+@lru_cache(maxsize=8)
+def _interpret_prefix(oc: str, target: str, display: int) -> str:
+    """법령해석례 요청 URL의 고정 부분 (page 값 직전까지)"""
+    params = urllib.parse.urlencode({
+        "OC": oc, "target": target, "type": "XML", "display": display,
+    })
+    return f"{API_ENDPOINTS['moel_interpret']}?{params}&page="
+
+
 def search_legal_interpret(
     query: str,
     display: int = 20,
     page: int = 1,
     target: str = "expc",
+    warn_auth: bool = True,
 ) -> Dict[str, Any]:
     """법령해석례 검색
 
@@ -335,6 +689,8 @@ def search_legal_interpret(
         display: 표시 건수 (최대 100)
         page: 페이지 번호
         target: API 타겟 (expc: 일반, moelCgmExpc: 고용노동부)
+        warn_auth: 인증 실패 시 stderr 경고 출력 여부
+            (여러 검색어를 동시에 조회할 때 같은 경고가 반복되지 않도록)
 
     Returns:
         검색 결과 딕셔너리 (total, results, error 키 포함)
@@ -345,55 +701,69 @@ def search_legal_interpret(
         print(f"Error: {e}", file=sys.stderr)
         return {"total": 0, "results": [], "error": "config_error"}
 
-    params = {
-        "OC": oc,
-        "target": target,
-        "type": "XML",
-        "query": query,
-        "display": display,
-        "page": page,
-    }
+    cache_key = _query_cache_key(
+        API_ENDPOINTS["moel_interpret"],
+        {"oc": oc, "query": query, "display": display, "page": page, "target": target},
+    )
+    cached = _query_cache_get(cache_key)
+    if cached is not None:
+        return cached
 
-    url = f"{API_ENDPOINTS['moel_interpret']}?{urllib.parse.urlencode(params)}"
+    url = (
+        f"{_interpret_prefix(oc, target, display)}{page}"
+        f"&query={urllib.parse.quote(query, safe='')}"
+    )
 
     try:
-        content = fetch_url(url)
-
-        # HTML 에러 페이지 감지 (인증 실패 등)
-        if _is_html_error_response(content):
-            print(f"Warning: API 인증 실패 (target={target})", file=sys.stderr)
-            print(f"  - 법령해석례(expc)는 별도 API 권한이 필요할 수 있습니다.", file=sys.stderr)
-            print(f"  - https://open.law.go.kr 에서 권한 확인 바랍니다.", file=sys.stderr)
-            return {"total": 0, "results": [], "error": "auth_failed"}
-
-        root = ET.fromstring(content)
+        with fetch_stream(url) as stream:
+            reader = io.BufferedReader(stream)
+
+            # HTML 에러 페이지 감지 (인증 실패 등) - 앞부분만 미리 확인
+            head = reader.peek(512)[:512].decode("utf-8", errors="ignore")
+            if _is_html_error_response(head):
+                if warn_auth:
+                    print(f"Warning: API 인증 실패 (target={target})", file=sys.stderr)
+                    print(f"  - 법령해석례(expc)는 별도 API 권한이 필요할 수 있습니다.", file=sys.stderr)
+                    print(f"  - https://open.law.go.kr 에서 권한 확인 바랍니다.", file=sys.stderr)
+                return {"total": 0, "results": [], "error": "auth_failed"}
+
+            # expc와 moelCgmExpc 두 가지 태그 모두 지원
+            handler = _parse_records(
+                reader,
+                _RecordHandler(
+                    record_tags=("expc", "moelCgmExpc"),
+                    value_tags=("totalCnt", "errorMsg", "retMsg"),
+                ),
+            )
 
         # XML 내부 에러 메시지 확인
-        error_msg = root.findtext(".//errorMsg") or root.findtext(".//retMsg")
+        error_msg = handler.values.get("errorMsg") or handler.values.get("retMsg")
         if error_msg and ("인증" in error_msg or "401" in error_msg):
-            print(f"Warning: API 인증 오류: {error_msg}", file=sys.stderr)
+            if warn_auth:
+                print(f"Warning: API 인증 오류: {error_msg}", file=sys.stderr)
             return {"total": 0, "results": [], "error": "auth_failed"}
 
-        results = []
-        # expc와 moelCgmExpc 두 가지 태그 모두 지원
-        for tag in ["expc", "moelCgmExpc"]:
-            for item in root.findall(f".//{tag}"):
-                results.append({
-                    "seq": _get_xml_field(item, "seq"),
-                    "title": _get_xml_field(item, "title"),
-                    "case_no": _get_xml_field(item, "case_no"),
-                    "query_org": _get_xml_field(item, "query_org"),
-                    "interpret_org": _get_xml_field(item, "interpret_org"),
-                    "interpret_date": _get_xml_field(item, "interpret_date"),
-                })
-
-        total = root.findtext(".//totalCnt", "0")
-        return {"total": int(total), "results": results}
+        results = [
+            {
+                "seq": _get_xml_field(item, "seq"),
+                "title": _get_xml_field(item, "title"),
+                "case_no": _get_xml_field(item, "case_no"),
+                "query_org": _get_xml_field(item, "query_org"),
+                "interpret_org": _get_xml_field(item, "interpret_org"),
+                "interpret_date": _get_xml_field(item, "interpret_date"),
+            }
+            for item in handler.records
+        ]
+        total = handler.values.get("totalCnt") or "0"
+
+        data = {"total": int(total), "results": results}
+        _query_cache_put(cache_key, data)
+        return data
 
     except RuntimeError as e:
         print(f"Error: 네트워크 오류: {e}", file=sys.stderr)
         return {"total": 0, "results": [], "error": "network_error"}
-    except ET.ParseError as e:
+    except xml.sax.SAXException as e:
         print(f"Error: XML 파싱 실패: {e}", file=sys.stderr)
         return {"total": 0, "results": [], "error": "parse_error"}
     except Exception as e:
@@ -403,30 +773,34 @@ def search_legal_interpret(
 
 def cmd_interpret(args):
     """법령해석례 검색 명령"""
+    out = []
     data = search_legal_interpret(args.query, args.display)
 
     if data.get("error") == "auth_failed":
-        print(f"\n⚠️  법령해석례 API 접근 권한이 없습니다.")
-        print(f"    https://open.law.go.kr 에서 권한 신청이 필요합니다.")
-        print(f"\n💡 대안: 웹검색으로 법령해석 사례를 조회하세요:")
-        print(f'   검색어: "{args.query} 법령해석" site:law.go.kr')
+        out.append(f"\n⚠️  법령해석례 API 접근 권한이 없습니다.")
+        out.append(f"    https://open.law.go.kr 에서 권한 신청이 필요합니다.")
+        out.append(f"\n💡 대안: 웹검색으로 법령해석 사례를 조회하세요:")
+        out.append(f'   검색어: "{args.query} 법령해석" site:law.go.kr')
+        _emit(out)
         return
 
     if data["total"] == 0:
         print(f"'{args.query}' 관련 법령해석례를 찾을 수 없습니다.")
         return
 
-    print(f"\n📋 법령해석례 (총 {data['total']}건 중 {len(data['results'])}건)")
-    print("=" * 60)
+    out.append(f"\n📋 법령해석례 (총 {data['total']}건 중 {len(data['results'])}건)")
+    out.append("=" * 60)
 
     for item in data["results"]:
-        print(f"\n📌 {item['title']}")
-        print(f"   안건번호: {item['case_no']}")
+        out.append(f"\n📌 {item['title']}")
+        out.append(f"   안건번호: {item['case_no']}")
         if item['query_org']:
-            print(f"   질의기관: {item['query_org']}")
+            out.append(f"   질의기관: {item['query_org']}")
         if item['interpret_org']:
-            print(f"   해석기관: {item['interpret_org']}")
-        print(f"   해석일자: {item['interpret_date']}")
+            out.append(f"   해석기관: {item['interpret_org']}")
+        out.append(f"   해석일자: {item['interpret_date']}")
+
+    _emit(out)
 
 
 # ============================================================
@@ -434,77 +808,170 @@ def cmd_interpret(args):
 # ============================================================
 
 
+# 입법예고 상태별 API diff 값과 표시명
+LEGISLATIVE_STATUSES = {
+    "ongoing": ("0", "진행중"),
+    "completed": ("1", "완료"),
+}
+
+
+def _fetch_legislative_page(url: str, status: str, display: int) -> Dict[str, Any]:
+    """입법예고 한 페이지 조회 및 파싱"""
+    status_name = LEGISLATIVE_STATUSES[status][1]
+
+    try:
+        with fetch_stream(url) as stream:
+            handler = _parse_records(
+                stream,
+                _RecordHandler(record_tags=("ogLmPp",), value_tags=("retMsg",), limit=display),
+            )
+
+        # 401 인증 오류 감지
+        if handler.values.get("retMsg", "").strip() == "401":
+            return {"error": "auth_failed", "results": []}
+
+        # XML 구조에 따라 파싱 (실제 응답 구조에 맞게 조정 필요)
+        results = [
+            {
+                "title": item.get("lsNm", ""),
+                "ministry": item.get("cptOfiNm", ""),
+                "notice_no": item.get("pntcNo", ""),
+                "start_date": item.get("stYd", ""),
+                "end_date": item.get("edYd", ""),
+                "status": status_name,
+            }
+            for item in handler.records
+        ]
+        return {"results": results}
+
+    except xml.sax.SAXException:
+        # XML 파싱 실패 시 빈 결과 반환
+        print(f"Warning: 입법예고 XML 파싱 실패", file=sys.stderr)
+        return {"error": "parse_error", "results": []}
+    except Exception as e:
+        print(f"Error: 입법예고 검색 실패: {e}", file=sys.stderr)
+        return {"error": str(e), "results": []}
+
+
+@lru_cache(maxsize=8)
+def _legislative_prefix(oc: str, diff: str) -> str:
+    """입법예고 요청 URL의 고정 부분 (인증키, 진행 상태)"""
+    params = urllib.parse.urlencode({"OC": oc, "diff": diff})
+    return f"{API_ENDPOINTS['legislative']}.xml?{params}"
+
+
 def search_legislative(
     status: str = "ongoing",
     law_name: str = None,
     days: int = 30,
     display: int = 20,
+    pages: Iterable[int] = (1,),
 ):
-    """입법예고 검색"""
+    """입법예고 검색
+
+    상태("all"이면 진행중+완료)와 페이지별 요청은 서로 독립이므로 동시에
+    보내고, 결과는 상태 > 페이지 순서로 합칩니다. display는 페이지마다
+    적용되므로 요청한 페이지는 모두 결과에 반영됩니다.
+
+    Args:
+        status: ongoing, completed 또는 all
+        law_name: 법령명 필터
+        days: 검색 기간 (일)
+        display: 페이지당 최대 건수
+        pages: 조회할 페이지 번호들 (1 이상)
+
+    Raises:
+        ValueError: 페이지 번호가 없거나 1보다 작은 경우
+    """
+    pages = tuple(pages)
+    if not pages or min(pages) < 1:
+        raise ValueError(f"페이지 번호는 1 이상이어야 합니다: {list(pages)}")
+
     oc = get_oc_code()
 
     # 날짜 범위 계산
     end_date = datetime.now()
     start_date = end_date - timedelta(days=days)
 
-    params = {
-        "OC": oc,
-        "diff": "0" if status == "ongoing" else "1",
+    # 기간은 오늘 기준이므로 종료일을 키에 포함
+    cache_key = _query_cache_key(
+        API_ENDPOINTS["legislative"],
+        {
+            "oc": oc,
+            "status": status,
+            "law_name": law_name,
+            "end_date": end_date.strftime("%Y%m%d"),
+            "days": days,
+            "display": display,
+            "pages": pages,
+        },
+    )
+    cached = _query_cache_get(cache_key)
+    if cached is not None:
+        return cached
+
+    statuses = list(LEGISLATIVE_STATUSES) if status == "all" else [status]
+    page_requests = [(st, page) for st in statuses for page in pages]
+
+    # 상태/페이지와 무관한 쿼리 부분은 한 번만 인코딩
+    common = urllib.parse.urlencode({
         "stYdFmt": start_date.strftime("%Y.%m.%d."),
         "edYdFmt": end_date.strftime("%Y.%m.%d."),
-    }
-
+    })
     if law_name:
-        params["lsNm"] = law_name
-
-    url = f"{API_ENDPOINTS['legislative']}.xml?{urllib.parse.urlencode(params)}"
-
-    try:
-        content = fetch_url(url)
-
-        # 401 인증 오류 감지
-        if "<retMsg>401</retMsg>" in content:
-            return {"error": "auth_failed", "results": []}
+        common += f"&lsNm={urllib.parse.quote(law_name, safe='')}"
 
-        root = ET.fromstring(content)
+    urls = []
+    for st, page in page_requests:
+        url = f"{_legislative_prefix(oc, LEGISLATIVE_STATUSES[st][0])}&{common}"
+        if page > 1:
+            url += f"&page={page}"
+        urls.append(url)
 
-        results = []
-        # XML 구조에 따라 파싱 (실제 응답 구조에 맞게 조정 필요)
-        for item in root.findall(".//ogLmPp"):
-            results.append({
-                "title": item.findtext("lsNm", ""),
-                "ministry": item.findtext("cptOfiNm", ""),
-                "notice_no": item.findtext("pntcNo", ""),
-                "start_date": item.findtext("stYd", ""),
-                "end_date": item.findtext("edYd", ""),
-                "status": "진행중" if status == "ongoing" else "완료",
-            })
-
-        return {"results": results[:display]}
-
-    except ET.ParseError:
-        # XML 파싱 실패 시 빈 결과 반환
-        print(f"Warning: 입법예고 XML 파싱 실패", file=sys.stderr)
-        return {"error": "parse_error", "results": []}
-    except Exception as e:
-        print(f"Error: 입법예고 검색 실패: {e}", file=sys.stderr)
-        return {"error": str(e), "results": []}
+    if len(urls) == 1:
+        pages_data = [_fetch_legislative_page(urls[0], statuses[0], display)]
+    else:
+        with ThreadPoolExecutor(max_workers=min(len(urls), 8)) as executor:
+            pages_data = list(executor.map(
+                _fetch_legislative_page,
+                urls,
+                [st for st, _ in page_requests],
+                [display] * len(urls),
+            ))
+
+    errors = [data["error"] for data in pages_data if data.get("error")]
+    if "auth_failed" in errors:
+        return {"error": "auth_failed", "results": []}
+
+    # page_requests가 상태 > 페이지 순서이므로 그대로 이어 붙임
+    results = [item for data in pages_data for item in data["results"]]
+    if errors and not results:
+        return {"error": errors[0], "results": []}
+
+    data = {"results": results}
+    # 일부 페이지가 실패한 결과는 저장하지 않음
+    if not errors:
+        _query_cache_put(cache_key, data)
+    return data
 
 
 def cmd_legislative(args):
     """입법예고 검색 명령"""
+    out = []
     data = search_legislative(
         status=args.status,
         law_name=args.law_name,
         days=args.days,
         display=args.display,
+        pages=range(1, args.pages + 1),
     )
 
     if data.get("error") == "auth_failed":
-        print(f"\n⚠️  입법예고 API 접근 권한이 없습니다.")
-        print(f"    국민참여입법센터에서 별도 권한 신청이 필요합니다.")
-        print(f"\n💡 대안: 웹사이트에서 직접 확인하세요:")
-        print(f"   https://opinion.lawmaking.go.kr (국민참여입법센터)")
+        out.append(f"\n⚠️  입법예고 API 접근 권한이 없습니다.")
+        out.append(f"    국민참여입법센터에서 별도 권한 신청이 필요합니다.")
+        out.append(f"\n💡 대안: 웹사이트에서 직접 확인하세요:")
+        out.append(f"   https://opinion.lawmaking.go.kr (국민참여입법센터)")
+        _emit(out)
         return
 
     results = data.get("results", [])
@@ -512,15 +979,17 @@ def cmd_legislative(args):
         print("입법예고 검색 결과가 없습니다.")
         return
 
-    status_str = "진행중" if args.status == "ongoing" else "완료"
-    print(f"\n📜 입법예고 ({status_str}, {len(results)}건)")
-    print("=" * 60)
+    status_str = "전체" if args.status == "all" else LEGISLATIVE_STATUSES[args.status][1]
+    out.append(f"\n📜 입법예고 ({status_str}, {len(results)}건)")
+    out.append("=" * 60)
 
     for item in results:
-        print(f"\n📌 {item['title']}")
-        print(f"   소관부처: {item['ministry']}")
-        print(f"   예고번호: {item['notice_no']}")
-        print(f"   예고기간: {item['start_date']} ~ {item['end_date']}")
+        out.append(f"\n📌 {item['title']}")
+        out.append(f"   소관부처: {item['ministry']}")
+        out.append(f"   예고번호: {item['notice_no']}")
+        out.append(f"   예고기간: {item['start_date']} ~ {item['end_date']}")
+
+    _emit(out)
 
 
 # ============================================================
@@ -528,73 +997,131 @@ def cmd_legislative(args):
 # ============================================================
 
 
+# summary 대상 부처/해석례 키워드
+SUMMARY_DEPTS = ["ftc", "moel", "fsc", "pipc"]
+SUMMARY_INTERPRET_KEYWORDS = ["해고", "임금", "근로시간"]
+
+# summary 항목 출력 템플릿 ({title:.50}은 50자 절단, 보도자료는 RssItem 속성 참조)
+_SUMMARY_RSS_TPL = "  - {0.title:.50}...\n    {0.link}".format
+_SUMMARY_INTERPRET_TPL = "  - {title:.50}...".format_map
+_SUMMARY_LEGISLATIVE_TPL = (
+    "  - [{ministry}] {title:.40}...\n    예고기간: {start_date} ~ {end_date}"
+).format_map
+
+
+def collect_summary(days: int = 7) -> Dict[str, Any]:
+    """정책 동향 요약 데이터 수집
+
+    Args:
+        days: 입법예고 검색 기간 (일)
+
+    Returns:
+        rss(부처 코드별 제재 관련 보도자료), interpret(키워드별 법령해석례),
+        legislative(진행중 입법예고) 키를 가진 딕셔너리
+    """
+    # RSS / 법령해석례 / 입법예고는 서로 독립적이므로 한꺼번에 전송하여
+    # 전체 소요 시간을 가장 느린 요청 하나 수준으로 줄임
+    with ThreadPoolExecutor(max_workers=len(SUMMARY_INTERPRET_KEYWORDS) + 2) as executor:
+        rss_future = executor.submit(fetch_rss, dept_code=None, limit=5)
+        # 인증 실패 경고는 첫 검색어만 출력 (순차 조회 시 첫 실패에서 멈추던 것과 동일)
+        interpret_futures = {
+            keyword: executor.submit(
+                search_legal_interpret, keyword, display=3, warn_auth=(i == 0)
+            )
+            for i, keyword in enumerate(SUMMARY_INTERPRET_KEYWORDS)
+        }
+        legislative_future = executor.submit(
+            search_legislative, status="ongoing", days=days, display=10
+        )
+
+    # 1. RSS 보도자료: 주요 부처의 제재 관련 항목만 추림
+    try:
+        rss_results = rss_future.result()
+    except Exception:
+        rss_results = []
+
+    rss = {}
+    for dept_code in SUMMARY_DEPTS:
+        relevant = [
+            r for r in rss_results
+            if r.dept_code == dept_code and has_enforcement_keyword(r.title)
+        ]
+        if relevant:
+            rss[dept_code] = relevant[:3]
+
+    # 2. 법령해석례
+    interpret = {}
+    for keyword, future in interpret_futures.items():
+        try:
+            interpret[keyword] = future.result()
+        except Exception as e:
+            interpret[keyword] = {"total": 0, "results": [], "error": str(e)}
+
+    # 3. 진행중 입법예고
+    try:
+        legislative = legislative_future.result()
+    except Exception as e:
+        legislative = {"error": str(e), "results": []}
+
+    return {"rss": rss, "interpret": interpret, "legislative": legislative}
+
+
 def cmd_summary(args):
     """정책 동향 종합 요약"""
-    print("\n" + "=" * 60)
-    print("📊 정부 정책 집행 동향 요약")
-    print("=" * 60)
+    summary = collect_summary(args.days)
+
+    if args.json:
+        sys.stdout.write(json.dumps(summary, ensure_ascii=False, default=asdict) + "\n")
+        return
+
+    out = []
+    out.append("\n" + "=" * 60)
+    out.append("📊 정부 정책 집행 동향 요약")
+    out.append("=" * 60)
 
     # 1. RSS 보도자료 (제재 관련)
-    print("\n\n## 1. 최근 보도자료 (제재/정책 관련)")
-    print("-" * 40)
-
-    enforcement_keywords = ["제재", "과징금", "시정명령", "시정조치", "위반", "처분"]
-
-    for dept_code, feed_info in RSS_FEEDS.items():
-        if dept_code in ["ftc", "moel", "fsc", "pipc"]:  # 주요 부처만
-            try:
-                if HAS_FEEDPARSER:
-                    results = fetch_rss(dept_code, limit=5)
-                    relevant = [r for r in results if any(kw in r["title"] for kw in enforcement_keywords)]
-                    if relevant:
-                        print(f"\n### {feed_info['name']}")
-                        for item in relevant[:3]:
-                            print(f"  - {item['title'][:50]}...")
-                            print(f"    {item['link']}")
-            except Exception:
-                pass
+    out.append("\n\n## 1. 최근 보도자료 (제재/정책 관련)")
+    out.append("-" * 40)
+
+    for dept_code, items in summary["rss"].items():
+        out.append(f"\n### {RSS_FEEDS_BY_CODE[dept_code].name}")
+        out.extend(map(_SUMMARY_RSS_TPL, items))
 
     # 2. 법령해석례 (최근)
-    print("\n\n## 2. 최근 주요 법령해석례")
-    print("-" * 40)
+    out.append("\n\n## 2. 최근 주요 법령해석례")
+    out.append("-" * 40)
 
-    for keyword in ["해고", "임금", "근로시간"]:
-        try:
-            data = search_legal_interpret(keyword, display=3)
-            if data.get("error") == "auth_failed":
-                print(f"\n  ⚠️ 법령해석례 API 권한 없음")
-                print(f"     웹검색 대안: \"{keyword} 법령해석\" site:law.go.kr")
-                break
-            if data["results"]:
-                print(f"\n### '{keyword}' 관련")
-                for item in data["results"][:2]:
-                    print(f"  - {item['title'][:50]}...")
-        except Exception:
-            pass
+    for keyword, data in summary["interpret"].items():
+        if data.get("error") == "auth_failed":
+            out.append(f"\n  ⚠️ 법령해석례 API 권한 없음")
+            out.append(f"     웹검색 대안: \"{keyword} 법령해석\" site:law.go.kr")
+            break
+        if data["results"]:
+            out.append(f"\n### '{keyword}' 관련")
+            out.extend(map(_SUMMARY_INTERPRET_TPL, data["results"][:2]))
 
     # 3. 입법예고
-    print("\n\n## 3. 진행중인 입법예고")
-    print("-" * 40)
+    out.append("\n\n## 3. 진행중인 입법예고")
+    out.append("-" * 40)
 
-    try:
-        data = search_legislative(status="ongoing", days=args.days, display=10)
-        if data.get("error") == "auth_failed":
-            print(f"  ⚠️ 입법예고 API 권한 없음")
-            print(f"     대안: https://opinion.lawmaking.go.kr")
-        elif data.get("results"):
-            for item in data["results"][:5]:
-                print(f"  - [{item['ministry']}] {item['title'][:40]}...")
-                print(f"    예고기간: {item['start_date']} ~ {item['end_date']}")
-        else:
-            print("  (검색 결과 없음)")
-    except Exception:
-        print("  (검색 실패)")
+    data = summary["legislative"]
+    if data.get("error") == "auth_failed":
+        out.append(f"  ⚠️ 입법예고 API 권한 없음")
+        out.append(f"     대안: https://opinion.lawmaking.go.kr")
+    elif data.get("results"):
+        out.extend(map(_SUMMARY_LEGISLATIVE_TPL, data["results"][:5]))
+    elif data.get("error"):
+        out.append("  (검색 실패)")
+    else:
+        out.append("  (검색 결과 없음)")
+
+    out.append("\n" + "=" * 60)
+    out.append("💡 상세 정보는 개별 명령으로 확인하세요:")
+    out.append("   python fetch_policy.py rss ftc --keyword 과징금")
+    out.append("   python fetch_policy.py interpret 해고")
+    out.append("   python fetch_policy.py legislative --status ongoing")
 
-    print("\n" + "=" * 60)
-    print("💡 상세 정보는 개별 명령으로 확인하세요:")
-    print("   python fetch_policy.py rss ftc --keyword 과징금")
-    print("   python fetch_policy.py interpret 해고")
-    print("   python fetch_policy.py legislative --status ongoing")
+    _emit(out)
 
 
 # ============================================================
@@ -637,6 +1164,17 @@ def cmd_gateway_status():
 # ============================================================
 
 
+def _positive_int(value: str) -> int:
+    """argparse용 1 이상 정수 타입"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"정수가 아닙니다: {value}") from None
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"1 이상이어야 합니다: {value}")
+    return number
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="정부 정책 집행 동향 수집",
@@ -655,14 +1193,26 @@ Examples:
   # 입법예고 검색
   python fetch_policy.py legislative --status ongoing
   python fetch_policy.py legislative --law-name "근로기준법"
+  python fetch_policy.py legislative --status all --pages 3
 
   # 종합 요약
   python fetch_policy.py summary --days 7
+  python fetch_policy.py summary --json
+  python fetch_policy.py summary --no-cache     # 캐시 무시하고 새로 조회
 
 Available dept codes: ftc, moel, fsc, pipc, moleg
         """,
     )
 
+    no_cache_help = "캐시된 법령해석례/입법예고 결과를 쓰지 않고 새로 조회"
+    parser.add_argument("--no-cache", action="store_true", help=no_cache_help)
+
+    # 조회 캐시를 쓰는 하위 명령 공용 옵션 (기본값을 두지 않아 상위 옵션 값을 덮지 않음)
+    cache_parent = argparse.ArgumentParser(add_help=False)
+    cache_parent.add_argument(
+        "--no-cache", action="store_true", default=argparse.SUPPRESS, help=no_cache_help,
+    )
+
     subparsers = parser.add_subparsers(dest="command", help="명령")
 
     # rss 명령
@@ -672,26 +1222,37 @@ Available dept codes: ftc, moel, fsc, pipc, moleg
     rss_parser.add_argument("--limit", "-l", type=int, default=20, help="최대 건수 (기본: 20)")
 
     # interpret 명령
-    interpret_parser = subparsers.add_parser("interpret", help="고용노동부 행정해석 검색")
+    interpret_parser = subparsers.add_parser(
+        "interpret", parents=[cache_parent], help="고용노동부 행정해석 검색",
+    )
     interpret_parser.add_argument("query", help="검색어")
     interpret_parser.add_argument("--display", "-d", type=int, default=20, help="표시 건수")
 
     # legislative 명령
-    leg_parser = subparsers.add_parser("legislative", help="입법예고 검색")
-    leg_parser.add_argument("--status", "-s", choices=["ongoing", "completed"], default="ongoing", help="상태")
+    leg_parser = subparsers.add_parser(
+        "legislative", parents=[cache_parent], help="입법예고 검색",
+    )
+    leg_parser.add_argument("--status", "-s", choices=["ongoing", "completed", "all"], default="ongoing", help="상태 (all: 진행중+완료)")
     leg_parser.add_argument("--law-name", "-n", help="법령명")
     leg_parser.add_argument("--days", "-d", type=int, default=30, help="검색 기간 (일)")
-    leg_parser.add_argument("--display", type=int, default=20, help="표시 건수")
+    leg_parser.add_argument("--display", type=int, default=20, help="페이지당 표시 건수")
+    leg_parser.add_argument("--pages", "-p", type=_positive_int, default=1, help="조회할 페이지 수 (동시 요청)")
 
     # summary 명령
-    summary_parser = subparsers.add_parser("summary", help="정책 동향 종합 요약")
+    summary_parser = subparsers.add_parser(
+        "summary", parents=[cache_parent], help="정책 동향 종합 요약",
+    )
     summary_parser.add_argument("--days", "-d", type=int, default=7, help="검색 기간 (일)")
+    summary_parser.add_argument("--json", action="store_true", help="JSON으로 출력 (다른 도구 연동용)")
 
     # gateway-status 명령
     gateway_parser = subparsers.add_parser("gateway-status", help="게이트웨이 상태 확인")
 
     args = parser.parse_args()
 
+    global _query_cache_enabled
+    _query_cache_enabled = not args.no_cache
+
     # 게이트웨이 상태 명령
     if args.command == "gateway-status":
         cmd_gateway_status()
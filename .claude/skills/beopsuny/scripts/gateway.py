@@ -16,6 +16,9 @@ Usage:
     # 자동 판단 (게이트웨이 설정 시 사용, 아니면 직접 접근)
     content = fetch_url("http://law.go.kr/...")
 
+    # 여러 URL 동시 요청 (결과는 입력 순서)
+    contents = fetch_many(["http://law.go.kr/...", "http://law.go.kr/..."])
+
     # 설정 확인
     if is_gateway_configured():
         print("Gateway ready")
@@ -25,40 +28,154 @@ Environment Variables:
     BEOPSUNY_GATEWAY_API_KEY: API 키 (선택, 게이트웨이에서 인증 설정 시)
 """
 
+import codecs
+import gzip
+import hashlib
+import http.client
+import json
 import os
+import pickle
 import socket
+import sys
+import threading
+import time
 import urllib.error
+import urllib.parse
 import urllib.request
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
-
-import yaml
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple
 
 # 스크립트 위치 기준 경로
 SCRIPT_DIR = Path(__file__).parent
 CONFIG_PATH = SCRIPT_DIR.parent / "config" / "settings.yaml"
+CONFIG_JSON_PATH = CONFIG_PATH.with_suffix(".json")  # build_skill.py가 함께 생성
+HTTP_CACHE_DIR = SCRIPT_DIR.parent / "data" / "http_cache"
+CONFIG_CACHE_DIR = SCRIPT_DIR.parent / "data" / "config_cache"  # 파싱된 settings.yaml
 
 # 환경변수 이름
 ENV_GATEWAY_URL = "BEOPSUNY_GATEWAY_URL"
 ENV_GATEWAY_API_KEY = "BEOPSUNY_GATEWAY_API_KEY"
 
-# 캐시
-_config_cache: Optional[dict] = None
+# 캐시 ((경로, mtime_ns, size), 설정) - 파일이 바뀌면 다시 로드
+_config_cache: Optional[Tuple[Optional[tuple], dict]] = None
+
+# 모든 요청의 기본 헤더 (호출 측 headers가 같은 키를 덮어씀)
+DEFAULT_HEADERS = {
+    "User-Agent": "Beopsuny/1.0",
+    "Accept-Encoding": "gzip",
+    "Connection": "keep-alive",  # 일부 중계 서버는 명시해야 연결을 유지
+}
+
+# keep-alive 연결 풀 (직접 접근/게이트웨이 공용) ((scheme, host) -> 유휴 연결 목록)
+_pool: Dict[Tuple[str, str], List[http.client.HTTPConnection]] = {}
+_pool_lock = threading.Lock()
+POOL_MAX_IDLE = 4  # 호스트당 유지할 유휴 연결 수
+MAX_REDIRECTS = 5
+FETCH_MANY_WORKERS = 8  # fetch_many 동시 요청 수
+READ_CHUNK_SIZE = 64 * 1024  # 응답 본문 읽기 단위
+
+# fetch_url 응답 캐시 (프로세스 내 LRU, (url, 헤더) -> (만료 시각, 본문))
+RESPONSE_CACHE_MAX = 512
+RESPONSE_CACHE_TTL = 15 * 60  # 초
+_response_cache: "OrderedDict[tuple, Tuple[float, str]]" = OrderedDict()
+_response_cache_lock = threading.Lock()
+
+# 게이트웨이 장애 차단 (연속 실패 시 일정 시간 재시도 없이 즉시 실패)
+GATEWAY_FAILURE_THRESHOLD = 3
+GATEWAY_COOLDOWN = 60  # 초
+_gateway_failures = 0
+_gateway_open_until = 0.0
+_gateway_state_lock = threading.Lock()
+
+# 게이트웨이 응답 재검증 캐시 (ETag/Last-Modified가 있는 응답만 저장)
+HTTP_CACHE_MAX_AGE = 10 * 24 * 60 * 60  # 초, 지나면 조건부 요청 없이 새로 받음
+_http_cache_pruned = False
+
+
+def _stat(path: Path) -> Optional[os.stat_result]:
+    """파일 stat (없으면 None)"""
+    try:
+        return path.stat()
+    except OSError:
+        return None
 
 
 def _load_config() -> dict:
-    """설정 파일 로드 (캐싱)"""
+    """설정 파일 로드 (캐싱)
+
+    빌드 시 생성된 settings.json이 settings.yaml보다 오래되지 않았으면
+    JSON을 읽고, 아니면 (사용자가 YAML을 수정한 경우 등) YAML을 읽습니다.
+    파일의 수정 시각/크기가 캐시와 같으면 다시 파싱하지 않으므로
+    오래 실행되는 프로세스에서도 stat 한 번으로 설정 변경을 반영합니다.
+    """
     global _config_cache
-    if _config_cache is not None:
-        return _config_cache
+    yaml_st = _stat(CONFIG_PATH)
+    json_st = _stat(CONFIG_JSON_PATH)
 
-    if CONFIG_PATH.exists():
-        with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-            _config_cache = yaml.safe_load(f) or {}
+    if json_st is not None and (yaml_st is None or json_st.st_mtime_ns >= yaml_st.st_mtime_ns):
+        path, st = CONFIG_JSON_PATH, json_st
+    elif yaml_st is not None:
+        path, st = CONFIG_PATH, yaml_st
     else:
-        _config_cache = {}
+        path, st = None, None
+
+    key = (path, st.st_mtime_ns, st.st_size) if st is not None else None
+    if _config_cache is not None and _config_cache[0] == key:
+        return _config_cache[1]
+
+    if path is CONFIG_JSON_PATH:
+        with open(path, "r", encoding="utf-8") as f:
+            config = json.load(f) or {}
+    elif path is CONFIG_PATH:
+        config = _load_yaml_config(st)
+    else:
+        config = {}
+
+    _config_cache = (key, config)
+    return config
+
+
+def _load_yaml_config(st: os.stat_result) -> dict:
+    """settings.yaml 파싱 (결과를 디스크에 캐싱)
+
+    settings.json이 없는 저장소 구조에서도 CLI를 실행할 때마다 YAML을
+    다시 파싱하지 않도록, 수정시각(ns)과 크기가 같으면 이전 실행에서
+    저장한 pickle을 재사용하고 달라지면 다시 파싱한 뒤 이전 캐시를 정리합니다.
+    """
+    cache_path = CONFIG_CACHE_DIR / f"settings_{st.st_mtime_ns}-{st.st_size}.pkl"
+
+    try:
+        with open(cache_path, "rb") as f:
+            return pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        pass  # 캐시 없음/손상 시 다시 파싱
+
+    import yaml  # 캐시 미스 시에만 필요 (CLI 시작 시간 단축)
+
+    try:
+        from yaml import CSafeLoader as YamlLoader  # libyaml 기반 (빠름)
+    except ImportError:
+        from yaml import SafeLoader as YamlLoader
+
+    with open(CONFIG_PATH, "r", encoding="utf-8") as f:
+        config = yaml.load(f, Loader=YamlLoader) or {}
+
+    try:
+        CONFIG_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        for stale in CONFIG_CACHE_DIR.glob("settings_*.pkl"):
+            stale.unlink(missing_ok=True)
+        # 임시 파일에 쓴 뒤 rename (동시 실행 시 반쯤 쓰인 캐시 방지)
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump(config, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass  # 읽기 전용 환경에서는 캐시 없이 동작
 
-    return _config_cache
+    return config
 
 
 def get_gateway_config() -> dict:
@@ -112,6 +229,154 @@ def _encode_url_for_gateway(url: str) -> str:
     return base64.urlsafe_b64encode(url.encode()).decode().rstrip('=')
 
 
+def _http_cache_paths(url: str) -> Tuple[Path, Path]:
+    """대상 URL의 재검증 캐시 파일 경로 (검증자 메타데이터, 본문)
+
+    파일 이름은 URL 해시만 사용하므로 OC 키가 담긴 URL은 저장하지 않습니다.
+    """
+    digest = hashlib.sha256(url.encode("utf-8")).hexdigest()[:32]
+    return HTTP_CACHE_DIR / f"{digest}.json", HTTP_CACHE_DIR / f"{digest}.body"
+
+
+def _load_http_cache(url: str) -> Optional[dict]:
+    """유효기간 내 재검증 캐시의 검증자 (etag, last_modified, saved_at)
+
+    본문은 크기가 클 수 있으므로 여기서 읽지 않고 304 응답일 때만
+    _load_http_cache_body()로 읽습니다.
+    """
+    meta_path, body_path = _http_cache_paths(url)
+    try:
+        with open(meta_path, "r", encoding="utf-8") as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if time.time() - entry.get("saved_at", 0) >= HTTP_CACHE_MAX_AGE:
+        return None
+    if not body_path.exists():
+        return None
+    return entry
+
+
+def _load_http_cache_body(url: str) -> Optional[str]:
+    """재검증 캐시 본문 (없으면 None)"""
+    try:
+        with open(_http_cache_paths(url)[1], "r", encoding="utf-8") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    """임시 파일에 쓴 뒤 교체 (동시 실행 중에도 반쯤 쓴 파일이 보이지 않도록)"""
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+def _prune_http_cache() -> None:
+    """유효기간이 지난 재검증 캐시 파일 삭제 (프로세스당 한 번)"""
+    global _http_cache_pruned
+    if _http_cache_pruned:
+        return
+    _http_cache_pruned = True
+
+    cutoff = time.time() - HTTP_CACHE_MAX_AGE
+    try:
+        paths = list(HTTP_CACHE_DIR.iterdir())
+    except OSError:
+        return
+    for path in paths:
+        st = _stat(path)
+        if st is not None and st.st_mtime < cutoff:
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+
+def _save_http_cache(
+    url: str,
+    etag: Optional[str],
+    last_modified: Optional[str],
+    body: Optional[str] = None,
+) -> None:
+    """재검증 캐시 저장 (실패해도 응답에는 영향 없음)
+
+    Args:
+        url: 대상 URL
+        etag: 응답 ETag
+        last_modified: 응답 Last-Modified
+        body: 응답 본문. None이면 검증자만 갱신 (304 응답)
+    """
+    meta_path, body_path = _http_cache_paths(url)
+    entry = {
+        "etag": etag,
+        "last_modified": last_modified,
+        "saved_at": time.time(),
+    }
+    try:
+        HTTP_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        _prune_http_cache()
+        # 본문을 먼저 써야 검증자만 있고 본문이 없는 상태가 생기지 않음
+        if body is not None:
+            _write_atomic(body_path, body)
+        else:
+            os.utime(body_path)  # 유효기간 정리 대상에서 제외
+        _write_atomic(meta_path, json.dumps(entry))
+    except OSError as e:
+        print(f"Warning: HTTP cache write failed: {e}", file=sys.stderr)
+
+
+def _gateway_request_url(gateway_url: str, url: str) -> str:
+    """게이트웨이 요청 URL 생성: {gateway}/fetch/{encoded_url}
+
+    게이트웨이 URL에 경로 접두사나 쿼리 문자열(예: ?token=...)이 있어도
+    /fetch/ 경로는 경로 부분에 붙이고 쿼리는 그대로 유지합니다.
+
+    Args:
+        gateway_url: 게이트웨이 기본 URL
+        url: 요청할 대상 URL
+
+    Returns:
+        게이트웨이 요청 URL
+    """
+    parts = urllib.parse.urlsplit(gateway_url)
+    path = f"{parts.path.rstrip('/')}/fetch/{_encode_url_for_gateway(url)}"
+    return urllib.parse.urlunsplit((parts.scheme, parts.netloc, path, parts.query, ""))
+
+
+def _check_gateway_circuit() -> None:
+    """게이트웨이가 차단 상태면 즉시 실패
+
+    Raises:
+        RuntimeError: 연속 실패로 차단 중인 경우
+    """
+    with _gateway_state_lock:
+        remaining = _gateway_open_until - time.monotonic()
+    if remaining > 0:
+        raise RuntimeError(
+            f"Gateway unavailable after {GATEWAY_FAILURE_THRESHOLD} consecutive failures "
+            f"(retry in {remaining:.0f}s)"
+        )
+
+
+def _record_gateway_result(ok: bool) -> None:
+    """게이트웨이 요청 결과 기록 (연속 실패가 임계값에 이르면 차단)
+
+    차단 해제 후 첫 요청이 다시 실패하면 곧바로 재차단됩니다.
+    """
+    global _gateway_failures, _gateway_open_until
+    with _gateway_state_lock:
+        if ok:
+            _gateway_failures = 0
+            return
+        _gateway_failures += 1
+        if _gateway_failures >= GATEWAY_FAILURE_THRESHOLD:
+            _gateway_open_until = time.monotonic() + GATEWAY_COOLDOWN
+
+
 def fetch_with_gateway(
     url: str,
     timeout: int = 30,
@@ -123,6 +388,12 @@ def fetch_with_gateway(
     URL은 Base64URL로 인코딩되어 /fetch/{encoded} 엔드포인트로 전송됩니다.
     이는 Cloudflare WAF의 Open Proxy 패턴 탐지를 우회하기 위함입니다.
 
+    연결 실패/5xx로 끝난 요청이 GATEWAY_FAILURE_THRESHOLD회 연속되면
+    GATEWAY_COOLDOWN초 동안은 재시도 대기 없이 바로 실패합니다.
+
+    이전 응답에 ETag/Last-Modified가 있었으면 If-None-Match/If-Modified-Since를
+    함께 보내고, 304 응답이면 저장해 둔 본문을 반환합니다.
+
     Args:
         url: 요청할 URL
         timeout: 타임아웃 (초)
@@ -136,9 +407,6 @@ def fetch_with_gateway(
         ValueError: 게이트웨이 미설정 시
         RuntimeError: 요청 실패 시
     """
-    import time
-    import sys
-
     config = get_gateway_config()
     gateway_url = config.get("url")
 
@@ -149,78 +417,315 @@ def fetch_with_gateway(
             "Example: export BEOPSUNY_GATEWAY_URL='https://your-gateway.example.com'"
         )
 
-    # Base64URL 인코딩 방식: {gateway}/fetch/{encoded_url}
-    encoded_url = _encode_url_for_gateway(url)
-    full_url = f"{gateway_url}/fetch/{encoded_url}"
+    full_url = _gateway_request_url(gateway_url, url)
 
-    # 헤더 설정
-    req_headers = {"User-Agent": "Beopsuny/1.0"}
+    # 헤더 설정 (기본 헤더는 _open_pooled에서 추가)
+    req_headers = {}
 
     # API 키 추가 (설정된 경우)
     api_key = config.get("api_key")
     if api_key:
         req_headers["x-api-key"] = api_key
 
+    # 조건부 요청 (변경 없으면 304로 본문 전송 생략)
+    cached = _load_http_cache(url)
+    if cached:
+        if cached.get("etag"):
+            req_headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            req_headers["If-Modified-Since"] = cached["last_modified"]
+
     if headers:
         req_headers.update(headers)
 
     last_error = None
     for attempt in range(max_retries):
-        req = urllib.request.Request(full_url, headers=req_headers)
+        # 다른 요청이 장애를 확인했으면 재시도 대기 없이 중단
+        _check_gateway_circuit()
 
+        # 게이트웨이 호스트도 keep-alive 풀을 통해 연결 재사용
         try:
-            with urllib.request.urlopen(req, timeout=timeout) as response:
-                return response.read().decode("utf-8")
-
-        except urllib.error.HTTPError as e:
-            if e.code == 401:
-                raise RuntimeError(
-                    "Gateway authentication failed (401).\n"
-                    f"Check your API key: {ENV_GATEWAY_API_KEY}"
-                ) from e
-            elif e.code == 403:
-                config = get_gateway_config()
-                if not config.get("api_key"):
-                    raise RuntimeError(
-                        "Gateway access forbidden (403).\n"
-                        "API key is required but not configured.\n"
-                        f"Set {ENV_GATEWAY_API_KEY} environment variable or add api_key to settings.yaml"
-                    ) from e
+            with _open_pooled(full_url, req_headers, timeout) as response:
+                status, reason = response.status, response.reason
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+                if status < 400:
+                    text = _read_text(_decoded_body(response))
                 else:
-                    raise RuntimeError(
-                        "Gateway access forbidden (403).\n"
-                        "The API key may be invalid or the gateway blocked this request."
-                    ) from e
-            elif e.code >= 500 and attempt < max_retries - 1:
-                # 5xx 에러는 재시도 (502, 503, 504 등)
-                wait_time = (attempt + 1) * 2  # 2초, 4초, 6초...
-                print(f"Gateway error {e.code}, retrying in {wait_time}s... (attempt {attempt + 1}/{max_retries})", file=sys.stderr)
-                time.sleep(wait_time)
-                last_error = e
-                continue
-            raise RuntimeError(f"Gateway HTTP error: {e.code} {e.reason}") from e
-        except urllib.error.URLError as e:
+                    response.read()  # 본문을 비워 연결 재사용
+        except (RuntimeError, OSError) as e:
+            # 연결 실패/타임아웃은 재시도
             if attempt < max_retries - 1:
-                wait_time = (attempt + 1) * 2
-                print(f"Gateway URL error, retrying in {wait_time}s... (attempt {attempt + 1}/{max_retries})", file=sys.stderr)
+                wait_time = (attempt + 1) * 2  # 2초, 4초, 6초...
+                print(f"Gateway {e}, retrying in {wait_time}s... (attempt {attempt + 1}/{max_retries})", file=sys.stderr)
                 time.sleep(wait_time)
                 last_error = e
                 continue
-            raise RuntimeError(f"Gateway URL error: {e.reason}") from e
-        except socket.timeout:
-            if attempt < max_retries - 1:
-                wait_time = (attempt + 1) * 2
-                print(f"Gateway timeout, retrying in {wait_time}s... (attempt {attempt + 1}/{max_retries})", file=sys.stderr)
-                time.sleep(wait_time)
-                last_error = socket.timeout(f"Gateway timeout after {timeout}s")
-                continue
-            raise RuntimeError(f"Gateway timeout after {timeout}s") from None
+            _record_gateway_result(False)
+            raise RuntimeError(f"Gateway {e}") from e
+
+        # 5xx가 아닌 응답이면 게이트웨이 자체는 정상
+        if status < 500:
+            _record_gateway_result(True)
+
+        if status == 304 and cached:
+            body = _load_http_cache_body(url)
+            if body is None:
+                # 확인 후 본문 파일이 사라졌으면 조건부 헤더 없이 다시 받음
+                return fetch_with_gateway(url, timeout, headers, max_retries)
+            _save_http_cache(url, etag or cached.get("etag"),
+                             last_modified or cached.get("last_modified"))
+            return body
+
+        if status < 400:
+            if etag or last_modified:
+                _save_http_cache(url, etag, last_modified, text)
+            return text
+
+        if status == 401:
+            raise RuntimeError(
+                "Gateway authentication failed (401).\n"
+                f"Check your API key: {ENV_GATEWAY_API_KEY}"
+            )
+        elif status == 403:
+            if not api_key:
+                raise RuntimeError(
+                    "Gateway access forbidden (403).\n"
+                    "API key is required but not configured.\n"
+                    f"Set {ENV_GATEWAY_API_KEY} environment variable or add api_key to settings.yaml"
+                )
+            else:
+                raise RuntimeError(
+                    "Gateway access forbidden (403).\n"
+                    "The API key may be invalid or the gateway blocked this request."
+                )
+        elif status >= 500 and attempt < max_retries - 1:
+            # 5xx 에러는 재시도 (502, 503, 504 등)
+            wait_time = (attempt + 1) * 2
+            print(f"Gateway error {status}, retrying in {wait_time}s... (attempt {attempt + 1}/{max_retries})", file=sys.stderr)
+            time.sleep(wait_time)
+            last_error = RuntimeError(f"Gateway HTTP error: {status} {reason}")
+            continue
+        if status >= 500:
+            _record_gateway_result(False)
+        raise RuntimeError(f"Gateway HTTP error: {status} {reason}")
 
     # 모든 재시도 실패
     if last_error:
         raise RuntimeError(f"Gateway failed after {max_retries} attempts: {last_error}") from last_error
 
 
+def _decoded_body(response) -> BinaryIO:
+    """Content-Encoding에 따라 압축을 풀며 읽는 본문 스트림
+
+    gzip 스트림은 원본 응답을 끝까지 읽으므로 keep-alive 연결 재사용에
+    영향이 없습니다.
+    """
+    content_encoding = (response.headers.get("Content-Encoding") or "").strip().lower()
+    if content_encoding in ("gzip", "x-gzip"):
+        return gzip.GzipFile(fileobj=response, mode="rb")
+    return response
+
+
+def _read_text(response, encoding: str = "utf-8") -> str:
+    """응답 본문을 청크 단위로 읽으며 디코딩
+
+    전체 본문을 bytes로 모은 뒤 한 번에 디코딩하지 않고, 도착한 청크를
+    바로 문자열로 바꿔 bytes 사본이 본문 크기만큼 쌓이지 않게 합니다.
+    멀티바이트 문자가 청크 경계에 걸쳐도 점진 디코더가 이어 붙입니다.
+
+    Raises:
+        RuntimeError: 읽는 도중 타임아웃/연결 끊김 시
+    """
+    decoder = codecs.getincrementaldecoder(encoding)()
+    parts = []
+    try:
+        while True:
+            chunk = response.read(READ_CHUNK_SIZE)
+            if not chunk:
+                break
+            parts.append(decoder.decode(chunk))
+    except socket.timeout:
+        raise RuntimeError("Read timeout while receiving response body") from None
+    except (OSError, EOFError, http.client.HTTPException) as e:
+        raise RuntimeError(f"URL error: {e}") from e
+    parts.append(decoder.decode(b"", final=True))
+    return "".join(parts)
+
+
+def _acquire_connection(
+    scheme: str, host: str, timeout: int
+) -> Tuple[http.client.HTTPConnection, bool]:
+    """풀에서 유휴 연결을 꺼내거나 새 연결 생성
+
+    Returns:
+        (연결, 재사용 여부)
+    """
+    with _pool_lock:
+        idle = _pool.get((scheme, host))
+        conn = idle.pop() if idle else None
+
+    if conn is not None:
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+        return conn, True
+
+    return _new_connection(scheme, host, timeout), False
+
+
+def _new_connection(scheme: str, host: str, timeout: int) -> http.client.HTTPConnection:
+    """새 HTTP(S) 연결 생성 (실제 접속은 첫 요청 시)"""
+    if scheme == "https":
+        return http.client.HTTPSConnection(host, timeout=timeout)
+    return http.client.HTTPConnection(host, timeout=timeout)
+
+
+def _release_connection(scheme: str, host: str, conn: http.client.HTTPConnection) -> None:
+    """응답을 끝까지 읽은 연결을 풀에 반환"""
+    with _pool_lock:
+        idle = _pool.setdefault((scheme, host), [])
+        if len(idle) < POOL_MAX_IDLE:
+            idle.append(conn)
+            return
+    conn.close()
+
+
+def _finish_response(
+    scheme: str,
+    host: str,
+    conn: http.client.HTTPConnection,
+    response: http.client.HTTPResponse,
+) -> None:
+    """응답 처리 종료 (끝까지 읽은 keep-alive 응답의 연결만 재사용)
+
+    isclosed()는 본문을 끝까지 읽었을 때뿐 아니라 중간에 close()한
+    경우에도 True이므로, close()로 설정되는 closed 플래그가 없을 때만
+    본문을 다 읽은 것으로 봅니다.
+    """
+    if response.isclosed() and not response.closed and not response.will_close:
+        _release_connection(scheme, host, conn)
+    else:
+        conn.close()
+
+
+def _send_request(
+    scheme: str,
+    host: str,
+    path: str,
+    headers: dict,
+    timeout: int,
+) -> Tuple[http.client.HTTPResponse, http.client.HTTPConnection]:
+    """GET 요청 전송 (재사용 연결이 서버 측에서 끊겼으면 새 연결로 1회 재시도)"""
+    conn, reused = _acquire_connection(scheme, host, timeout)
+    try:
+        try:
+            conn.request("GET", path, headers=headers)
+            return conn.getresponse(), conn
+        except (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError):
+            if not reused:
+                raise
+            # 유휴 중 서버가 끊은 연결 - 새 연결로 재시도
+            conn.close()
+            conn = _new_connection(scheme, host, timeout)
+            conn.request("GET", path, headers=headers)
+            return conn.getresponse(), conn
+    except socket.timeout:
+        conn.close()
+        raise RuntimeError(f"Request timeout after {timeout}s") from None
+    except (OSError, http.client.HTTPException) as e:
+        conn.close()
+        raise RuntimeError(f"URL error: {e}") from e
+
+
+@contextmanager
+def _open_pooled(
+    url: str,
+    headers: dict,
+    timeout: int,
+) -> Iterator[http.client.HTTPResponse]:
+    """URL 열기 (리다이렉트 처리, HTTP 오류 상태도 응답으로 반환)
+
+    같은 호스트에 대한 연속 요청은 keep-alive 연결을 재사용하여
+    TCP/TLS 핸드셰이크를 생략합니다. 응답을 끝까지 읽으면 연결이 풀로
+    반환되고, 중간에 닫으면 연결도 함께 닫힙니다.
+
+    DEFAULT_HEADERS에 headers를 덮어써서 보냅니다. 압축 전송(gzip)을
+    기본으로 요청하므로 본문은 _decoded_body()로 읽어야 합니다.
+
+    Raises:
+        RuntimeError: 연결 실패, 타임아웃, 리다이렉트 초과 시
+    """
+    headers = {**DEFAULT_HEADERS, **headers}
+    parts = urllib.parse.urlsplit(url)
+    if (
+        urllib.request.getproxies().get(parts.scheme)
+        and not urllib.request.proxy_bypass(parts.hostname or "")
+    ):
+        # 시스템 프록시 환경은 urllib에 맡김 (프록시 인증/터널링 지원)
+        req = urllib.request.Request(url, headers=headers)
+        try:
+            response = urllib.request.urlopen(req, timeout=timeout)
+        except urllib.error.HTTPError as e:
+            response = e  # 오류 응답도 status/reason/read() 지원
+        except urllib.error.URLError as e:
+            raise RuntimeError(f"URL error: {e.reason}") from e
+        except socket.timeout:
+            raise RuntimeError(f"Request timeout after {timeout}s") from None
+        with response:
+            yield response
+        return
+
+    for _ in range(MAX_REDIRECTS + 1):
+        parts = urllib.parse.urlsplit(url)
+        if parts.scheme not in ("http", "https"):
+            raise RuntimeError(f"URL error: unsupported scheme '{parts.scheme}'")
+        path = urllib.parse.urlunsplit(("", "", parts.path or "/", parts.query, ""))
+
+        response, conn = _send_request(parts.scheme, parts.netloc, path, headers, timeout)
+
+        location = response.getheader("Location")
+        if response.status in (301, 302, 303, 307, 308) and location:
+            response.read()
+            _finish_response(parts.scheme, parts.netloc, conn, response)
+            url = urllib.parse.urljoin(url, location)
+            continue
+        break
+    else:
+        raise RuntimeError(f"URL error: too many redirects ({MAX_REDIRECTS})")
+
+    try:
+        yield response
+    finally:
+        _finish_response(parts.scheme, parts.netloc, conn, response)
+
+
+@contextmanager
+def open_direct(
+    url: str,
+    timeout: int = 30,
+    headers: Optional[dict] = None,
+) -> Iterator[BinaryIO]:
+    """직접 URL 열기 (게이트웨이 없이, 스트리밍)
+
+    Args:
+        url: 요청할 URL
+        timeout: 타임아웃 (초)
+        headers: 추가 헤더
+
+    Yields:
+        응답 본문 스트림 (read() 지원, gzip 전송은 압축 해제됨)
+
+    Raises:
+        RuntimeError: 요청 실패 시
+    """
+    with _open_pooled(url, headers or {}, timeout) as response:
+        if response.status >= 400:
+            response.read()  # 본문을 비워 연결 재사용
+            raise RuntimeError(f"HTTP error {response.status}: {response.reason}")
+        yield _decoded_body(response)
+
+
 def fetch_direct(
     url: str,
     timeout: int = 30,
@@ -239,19 +744,9 @@ def fetch_direct(
     Raises:
         RuntimeError: 요청 실패 시
     """
-    req_headers = {"User-Agent": "Beopsuny/1.0"}
-    if headers:
-        req_headers.update(headers)
-
-    req = urllib.request.Request(url, headers=req_headers)
-
     try:
-        with urllib.request.urlopen(req, timeout=timeout) as response:
-            return response.read().decode("utf-8")
-    except urllib.error.HTTPError as e:
-        raise RuntimeError(f"HTTP error {e.code}: {e.reason}") from e
-    except urllib.error.URLError as e:
-        raise RuntimeError(f"URL error: {e.reason}") from e
+        with open_direct(url, timeout, headers) as response:
+            return _read_text(response)
     except socket.timeout:
         raise RuntimeError(f"Request timeout after {timeout}s") from None
 
@@ -261,28 +756,105 @@ def fetch_url(
     timeout: int = 30,
     headers: Optional[dict] = None,
     use_gateway: Optional[bool] = None,
+    use_cache: bool = True,
+    cache_ttl: Optional[int] = None,
 ) -> str:
     """URL 가져오기 (게이트웨이 자동 판단)
 
     게이트웨이가 설정되어 있으면 게이트웨이를 사용하고,
-    그렇지 않으면 직접 접근합니다.
+    그렇지 않으면 직접 접근합니다. 같은 URL/헤더의 응답은 프로세스 내
+    LRU 캐시에서 재사용합니다.
 
     Args:
         url: 요청할 URL
         timeout: 타임아웃 (초)
         headers: 추가 헤더
         use_gateway: 게이트웨이 사용 여부 (None이면 자동 판단)
+        use_cache: 응답 캐시 사용 여부
+        cache_ttl: 캐시 유효 시간 (초, None이면 RESPONSE_CACHE_TTL)
 
     Returns:
         응답 본문 (문자열)
     """
+    key = (url, tuple(sorted((headers or {}).items())))
+    if use_cache:
+        with _response_cache_lock:
+            cached = _response_cache.get(key)
+            if cached is not None:
+                if cached[0] > time.monotonic():
+                    _response_cache.move_to_end(key)
+                    return cached[1]
+                del _response_cache[key]
+
     if use_gateway is None:
         use_gateway = is_gateway_configured()
 
     if use_gateway:
-        return fetch_with_gateway(url, timeout, headers)
+        body = fetch_with_gateway(url, timeout, headers)
     else:
-        return fetch_direct(url, timeout, headers)
+        body = fetch_direct(url, timeout, headers)
+
+    if use_cache:
+        ttl = RESPONSE_CACHE_TTL if cache_ttl is None else cache_ttl
+        with _response_cache_lock:
+            _response_cache[key] = (time.monotonic() + ttl, body)
+            _response_cache.move_to_end(key)
+            while len(_response_cache) > RESPONSE_CACHE_MAX:
+                _response_cache.popitem(last=False)
+
+    return body
+
+
+def clear_response_cache() -> None:
+    """fetch_url 응답 캐시 비우기"""
+    with _response_cache_lock:
+        _response_cache.clear()
+
+
+def fetch_many(
+    urls: Iterable[str],
+    timeout: int = 30,
+    headers: Optional[dict] = None,
+    use_gateway: Optional[bool] = None,
+    max_workers: int = FETCH_MANY_WORKERS,
+) -> List[str]:
+    """여러 URL을 동시에 가져오기
+
+    요청별 대기 시간(해외에서는 RTT가 큼)이 겹치도록 최대 max_workers개를
+    동시에 보냅니다. 연결은 keep-alive 풀에서 재사용되고, 중복 URL은
+    한 번만 요청합니다.
+
+    Args:
+        urls: 요청할 URL 목록
+        timeout: 요청별 타임아웃 (초)
+        headers: 추가 헤더
+        use_gateway: 게이트웨이 사용 여부 (None이면 자동 판단)
+        max_workers: 최대 동시 요청 수
+
+    Returns:
+        응답 본문 목록 (입력 순서)
+
+    Raises:
+        RuntimeError: 하나라도 요청이 실패한 경우
+    """
+    urls = list(urls)
+    if not urls:
+        return []
+
+    if use_gateway is None:
+        use_gateway = is_gateway_configured()
+
+    # 중복 URL은 한 번만 요청
+    unique_urls = list(dict.fromkeys(urls))
+    if len(unique_urls) == 1:
+        body = fetch_url(unique_urls[0], timeout, headers, use_gateway)
+        return [body] * len(urls)
+
+    with ThreadPoolExecutor(max_workers=min(len(unique_urls), max_workers)) as executor:
+        bodies = dict(zip(unique_urls, executor.map(
+            lambda url: fetch_url(url, timeout, headers, use_gateway), unique_urls
+        )))
+    return [bodies[url] for url in urls]
 
 
 # 하위 호환성을 위한 별칭
@@ -291,13 +863,14 @@ def fetch_with_proxy(
     timeout: int = 30,
     headers: Optional[dict] = None,
     force_proxy: bool = False,
+    use_cache: bool = True,
 ) -> str:
     """(하위 호환) fetch_url의 별칭
 
     기존 코드와의 호환성을 위해 유지됩니다.
     새 코드는 fetch_url() 또는 fetch_with_gateway()를 사용하세요.
     """
-    return fetch_url(url, timeout, headers, use_gateway=force_proxy or None)
+    return fetch_url(url, timeout, headers, use_gateway=force_proxy or None, use_cache=use_cache)
 
 
 def is_overseas() -> bool:
@@ -321,8 +894,6 @@ def get_geo_status() -> dict:
 
 # CLI 테스트용
 if __name__ == "__main__":
-    import sys
-
     print("=" * 50)
     print("🌏 Beopsuny Gateway Utils - 상태 확인")
     print("=" * 50)
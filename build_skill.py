@@ -4,6 +4,8 @@
 Claude Desktop용 zip 파일을 생성합니다.
 """
 
+import argparse
+import json
 import os
 import sys
 import zipfile
@@ -70,6 +72,51 @@ def get_api_keys() -> tuple[str, str, dict]:
     return oc_code, assembly_api_key, gateway_config
 
 
+# settings.yaml/settings.json 공통 설정값 (두 파일 모두 여기서 생성)
+API_SETTINGS = {
+    "base_url": "http://www.law.go.kr/DRF",
+    "timeout": 30,
+    "default_display": 20,
+}
+API_SETTING_COMMENTS = {"default_display": "기본 검색 결과 수"}
+SEARCH_TARGETS = {
+    "law": "법령",
+    "prec": "판례",
+    "ordin": "자치법규",
+    "admrul": "행정규칙",
+    "expc": "법령해석례",
+    "detc": "헌재결정례",
+}
+
+
+def _yaml_mapping(values: dict, comments: dict = None) -> str:
+    """1단계 매핑을 들여쓴 YAML 줄로 변환 (문자열은 큰따옴표)"""
+    lines = []
+    for key, value in values.items():
+        line = f'  {key}: "{value}"' if isinstance(value, str) else f"  {key}: {value}"
+        if comments and key in comments:
+            line += f"  # {comments[key]}"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def create_settings_dict(oc_code: str, assembly_api_key: str = "", gateway_config: dict = None) -> dict:
+    """settings.json 내용을 생성합니다. (settings.yaml과 같은 설정, 스크립트 빠른 로드용)"""
+    settings = {"oc_code": oc_code}
+    if assembly_api_key:
+        settings["assembly_api_key"] = assembly_api_key
+
+    settings["api"] = dict(API_SETTINGS)
+    settings["targets"] = dict(SEARCH_TARGETS)
+
+    if gateway_config and gateway_config.get("url"):
+        settings["gateway"] = {"url": gateway_config.get("url")}
+        if gateway_config.get("api_key"):
+            settings["gateway"]["api_key"] = gateway_config.get("api_key")
+
+    return settings
+
+
 def create_settings_yaml(oc_code: str, assembly_api_key: str = "", gateway_config: dict = None) -> str:
     """settings.yaml 내용을 생성합니다."""
     assembly_line = f'assembly_api_key: "{assembly_api_key}"' if assembly_api_key else '# assembly_api_key: ""  # 열린국회정보 API 키 (https://open.assembly.go.kr)'
@@ -108,21 +155,37 @@ oc_code: "{oc_code}"
 
 # API Settings
 api:
-  base_url: "http://www.law.go.kr/DRF"
-  timeout: 30
-  default_display: 20  # 기본 검색 결과 수
+{_yaml_mapping(API_SETTINGS, API_SETTING_COMMENTS)}
 
 # 검색 대상 코드
 targets:
-  law: "법령"
-  prec: "판례"
-  ordin: "자치법규"
-  admrul: "행정규칙"
-  expc: "법령해석례"
-  detc: "헌재결정례"
+{_yaml_mapping(SEARCH_TARGETS)}
 {gateway_section}'''
 
 
+# 압축 이득이 없는 작은 항목은 무압축 저장
+ZIP_STORED_THRESHOLD = 64  # bytes
+# 재현 가능한 빌드를 위한 고정 타임스탬프 (ZIP 형식의 최소값)
+ZIP_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+
+def _add_to_zip(zf: zipfile.ZipFile, arcname: str, data, mode: int = 0o644) -> None:
+    """zip에 항목 추가 (고정 타임스탬프, 작은 항목은 무압축)"""
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+
+    info = zipfile.ZipInfo(arcname, date_time=ZIP_DATE_TIME)
+    info.compress_type = zipfile.ZIP_STORED if len(data) < ZIP_STORED_THRESHOLD else zipfile.ZIP_DEFLATED
+    info.external_attr = mode << 16
+    zf.writestr(info, data)
+
+
+def _add_file_to_zip(zf: zipfile.ZipFile, path: Path, arcname: str) -> None:
+    """파일을 zip에 추가 (git처럼 실행 여부만 반영한 755/644 권한)"""
+    mode = 0o755 if path.stat().st_mode & 0o111 else 0o644
+    _add_to_zip(zf, arcname, path.read_bytes(), mode)
+
+
 def build_zip(oc_code: str, assembly_api_key: str, output_path: Path, gateway_config: dict = None) -> None:
     """스킬 zip 파일을 생성합니다."""
     script_dir = Path(__file__).parent
@@ -140,27 +203,35 @@ def build_zip(oc_code: str, assembly_api_key: str, output_path: Path, gateway_co
         # SKILL.md
         skill_md = skill_dir / "SKILL.md"
         if skill_md.exists():
-            zf.write(skill_md, "beopsuny/SKILL.md")
+            _add_file_to_zip(zf, skill_md, "beopsuny/SKILL.md")
 
         # config/settings.yaml (API 키 및 게이트웨이 설정 주입)
         settings_content = create_settings_yaml(oc_code, assembly_api_key, gateway_config)
-        zf.writestr("beopsuny/config/settings.yaml", settings_content)
+        _add_to_zip(zf, "beopsuny/config/settings.yaml", settings_content)
+
+        # config/settings.json (같은 설정, YAML 파싱 없이 로드)
+        settings_json = json.dumps(
+            create_settings_dict(oc_code, assembly_api_key, gateway_config),
+            ensure_ascii=False,
+            indent=2,
+        )
+        _add_to_zip(zf, "beopsuny/config/settings.json", settings_json)
 
         # config/law_index.yaml (법령 인덱스)
         law_index = skill_dir / "config" / "law_index.yaml"
         if law_index.exists():
-            zf.write(law_index, "beopsuny/config/law_index.yaml")
+            _add_file_to_zip(zf, law_index, "beopsuny/config/law_index.yaml")
 
         # scripts/*.py
         scripts_dir = skill_dir / "scripts"
         if scripts_dir.exists():
-            for py_file in scripts_dir.glob("*.py"):
-                zf.write(py_file, f"beopsuny/scripts/{py_file.name}")
+            for py_file in sorted(scripts_dir.glob("*.py")):
+                _add_file_to_zip(zf, py_file, f"beopsuny/scripts/{py_file.name}")
 
         # data 디렉토리 구조 (빈 디렉토리용 .gitkeep)
-        zf.writestr("beopsuny/data/raw/.gitkeep", "")
-        zf.writestr("beopsuny/data/parsed/.gitkeep", "")
-        zf.writestr("beopsuny/data/bills/.gitkeep", "")
+        _add_to_zip(zf, "beopsuny/data/raw/.gitkeep", "")
+        _add_to_zip(zf, "beopsuny/data/parsed/.gitkeep", "")
+        _add_to_zip(zf, "beopsuny/data/bills/.gitkeep", "")
 
     print()
     print(f"✓ 스킬 zip 파일이 생성되었습니다: {output_path}")
@@ -178,63 +249,34 @@ def build_zip(oc_code: str, assembly_api_key: str, output_path: Path, gateway_co
 
 def main():
     # 명령줄 인자로 API 키 받기
-    oc_code = None
-    assembly_api_key = None
-    gateway_url = None
-    gateway_api_key = None
-    force_overwrite = False
-
-    args = sys.argv[1:]
-    i = 0
-    while i < len(args):
-        arg = args[i]
-        if arg in ("--oc-code", "-o") and i + 1 < len(args):
-            oc_code = args[i + 1]
-            i += 2
-        elif arg.startswith("--oc-code="):
-            oc_code = arg.split("=", 1)[1]
-            i += 1
-        elif arg in ("--assembly-key", "-a") and i + 1 < len(args):
-            assembly_api_key = args[i + 1]
-            i += 2
-        elif arg.startswith("--assembly-key="):
-            assembly_api_key = arg.split("=", 1)[1]
-            i += 1
-        elif arg in ("--gateway-url", "-g") and i + 1 < len(args):
-            gateway_url = args[i + 1]
-            i += 2
-        elif arg.startswith("--gateway-url="):
-            gateway_url = arg.split("=", 1)[1]
-            i += 1
-        elif arg in ("--gateway-key", "-k") and i + 1 < len(args):
-            gateway_api_key = args[i + 1]
-            i += 2
-        elif arg.startswith("--gateway-key="):
-            gateway_api_key = arg.split("=", 1)[1]
-            i += 1
-        elif arg in ("--force", "-f"):
-            force_overwrite = True
-            i += 1
-        elif arg in ("--help", "-h"):
-            print("사용법: python build_skill.py [옵션]")
-            print()
-            print("옵션:")
-            print("  -o, --oc-code=CODE       국가법령정보 OC 코드 (필수)")
-            print("  -a, --assembly-key=KEY   열린국회정보 API 키 (선택)")
-            print("  -g, --gateway-url=URL    게이트웨이 URL (선택, 해외 접근용)")
-            print("                           예: https://your-gateway.example.com")
-            print("  -k, --gateway-key=KEY    게이트웨이 API 키 (선택, 인증 필요 시)")
-            print("  -f, --force              기존 파일 덮어쓰기 (확인 없이)")
-            print("  -h, --help               도움말 표시")
-            print()
-            print("예시:")
-            print("  python build_skill.py")
-            print("  python build_skill.py --oc-code=myoccode")
-            print("  python build_skill.py -o myoccode -g https://my-gateway.com -k myapikey")
-            print("  python build_skill.py -o myoccode -f  # 확인 없이 덮어쓰기")
-            sys.exit(0)
-        else:
-            i += 1
+    parser = argparse.ArgumentParser(
+        description="법수니 (beopsuny) 스킬 zip 빌드",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+예시:
+  python build_skill.py
+  python build_skill.py --oc-code=myoccode
+  python build_skill.py -o myoccode -g https://my-gateway.com -k myapikey
+  python build_skill.py -o myoccode -f  # 확인 없이 덮어쓰기
+
+OC 코드를 지정하지 않으면 대화형으로 입력받습니다.
+        """,
+    )
+    parser.add_argument("--oc-code", "-o", metavar="CODE", help="국가법령정보 OC 코드 (필수)")
+    parser.add_argument("--assembly-key", "-a", metavar="KEY", help="열린국회정보 API 키 (선택)")
+    parser.add_argument(
+        "--gateway-url", "-g", metavar="URL",
+        help="게이트웨이 URL (선택, 해외 접근용, 예: https://your-gateway.example.com)",
+    )
+    parser.add_argument("--gateway-key", "-k", metavar="KEY", help="게이트웨이 API 키 (선택, 인증 필요 시)")
+    parser.add_argument("--force", "-f", action="store_true", help="기존 파일 덮어쓰기 (확인 없이)")
+    args = parser.parse_args()
+
+    oc_code = args.oc_code
+    assembly_api_key = args.assembly_key
+    gateway_url = args.gateway_url
+    gateway_api_key = args.gateway_key
+    force_overwrite = args.force
 
     # 게이트웨이 설정 구성
     gateway_config = {}